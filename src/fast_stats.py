@@ -0,0 +1,182 @@
+# src/fast_stats.py
+"""
+Numba-accelerated statistics kernels for the analysis hot paths
+
+All helpers degrade gracefully: if numba is not installed they return None
+and the caller falls back to the pandas/numpy implementation.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    # No fastmath here: the kernel relies on np.isnan, which fastmath's
+    # no-NaN assumption would break
+    @njit(parallel=True, cache=True)
+    def _pairwise_pearson(M):
+        n, k = M.shape
+        out = np.eye(k)
+        for i in prange(k):
+            for j in range(i + 1, k):
+                # One fused pass over pairwise-complete observations
+                sx = 0.0
+                sy = 0.0
+                sxx = 0.0
+                syy = 0.0
+                sxy = 0.0
+                cnt = 0
+                for r in range(n):
+                    x = M[r, i]
+                    y = M[r, j]
+                    if np.isnan(x) or np.isnan(y):
+                        continue
+                    cnt += 1
+                    sx += x
+                    sy += y
+                    sxx += x * x
+                    syy += y * y
+                    sxy += x * y
+                if cnt < 2:
+                    out[i, j] = np.nan
+                    out[j, i] = np.nan
+                    continue
+                var_x = cnt * sxx - sx * sx
+                var_y = cnt * syy - sy * sy
+                if var_x <= 0.0 or var_y <= 0.0:
+                    out[i, j] = np.nan
+                    out[j, i] = np.nan
+                    continue
+                r_ij = (cnt * sxy - sx * sy) / np.sqrt(var_x * var_y)
+                out[i, j] = r_ij
+                out[j, i] = r_ij
+        return out
+
+
+if HAVE_NUMBA:
+
+    @njit(fastmath=True, cache=True)
+    def _hist_kernel(x, lo, hi, nb):
+        counts = np.zeros(nb, np.int64)
+        inv = nb / (hi - lo)
+        for i in range(x.shape[0]):
+            b = int((x[i] - lo) * inv)
+            if b == nb:
+                b = nb - 1  # right edge is closed, matching np.histogram
+            if 0 <= b < nb:
+                counts[b] += 1
+        return counts
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _popcount64(x):
+        # SWAR popcount of one 64-bit word
+        x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        x = ((x & np.uint64(0x3333333333333333))
+             + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333)))
+        x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+    @njit(cache=True)
+    def _pack_columns(B):
+        n, k = B.shape
+        nwords = (n + 63) // 64
+        packed = np.zeros((k, nwords), np.uint64)
+        for j in range(k):
+            for i in range(n):
+                if B[i, j]:
+                    packed[j, i >> 6] |= np.uint64(1) << np.uint64(i & 63)
+        return packed
+
+    @njit(parallel=True, cache=True)
+    def _phi_from_bitsets(packed, n):
+        k = packed.shape[0]
+        nwords = packed.shape[1]
+        ones = np.zeros(k, np.uint64)
+        for j in range(k):
+            c = np.uint64(0)
+            for w in range(nwords):
+                c += _popcount64(packed[j, w])
+            ones[j] = c
+        out = np.eye(k)
+        nf = np.float64(n)
+        for i in prange(k):
+            for j in range(i + 1, k):
+                n11 = np.uint64(0)
+                for w in range(nwords):
+                    n11 += _popcount64(packed[i, w] & packed[j, w])
+                n1 = np.float64(ones[i])
+                n2 = np.float64(ones[j])
+                num = nf * np.float64(n11) - n1 * n2
+                den = n1 * (nf - n1) * n2 * (nf - n2)
+                if den <= 0.0:
+                    out[i, j] = np.nan
+                    out[j, i] = np.nan
+                else:
+                    r = num / np.sqrt(den)
+                    out[i, j] = r
+                    out[j, i] = r
+        return out
+
+
+def phi_matrix(B):
+    """Pearson (phi) correlation matrix of a (n, k) boolean indicator array
+
+    Each column is packed into 64-bit bitset words, so every pair
+    correlation reduces to AND + popcount over the words; pairs run in
+    parallel across cores. Equals Pearson correlation of the 0/1 columns.
+    Returns None when numba is unavailable so callers can fall back to the
+    float path.
+    """
+    if not HAVE_NUMBA:
+        return None
+    B = np.ascontiguousarray(B, dtype=np.bool_)
+    return _phi_from_bitsets(_pack_columns(B), B.shape[0])
+
+
+def histogram(x, bins=30):
+    """Bin a 1-D float array into equal-width bins with a compiled loop
+
+    Returns (counts, edges) like np.histogram, or None when numba is
+    unavailable or the data is degenerate (empty, non-finite, constant) so
+    callers can fall back to plt.hist.
+    """
+    if not HAVE_NUMBA:
+        return None
+    # Keep float32 input as-is: half the bytes through the binning loop
+    x = np.ascontiguousarray(x)
+    if x.dtype not in (np.float32, np.float64):
+        x = x.astype(np.float64)
+    if x.size == 0:
+        return None
+    lo = x.min()
+    hi = x.max()
+    if not np.isfinite(lo) or not np.isfinite(hi) or lo == hi:
+        return None
+    counts = _hist_kernel(x, lo, hi, bins)
+    edges = np.linspace(lo, hi, bins + 1)
+    return counts, edges
+
+
+def pearson_matrix(M):
+    """Pairwise-complete Pearson correlation matrix of a (n, k) float array
+
+    Column pairs are distributed over all cores and each pair is computed in
+    a single compiled pass, NaNs skipped in-loop. Returns None when numba is
+    unavailable so callers can fall back to df.corr().
+    """
+    if not HAVE_NUMBA:
+        return None
+    # float32 input is read as-is (half the bandwidth); the kernel's
+    # accumulators are float64 scalars either way, so precision holds
+    M = np.ascontiguousarray(M)
+    if M.dtype not in (np.float32, np.float64):
+        M = M.astype(np.float64)
+    return _pairwise_pearson(M)
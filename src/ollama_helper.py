@@ -7,6 +7,36 @@ import json
 import os
 from typing import Optional, Dict, Any
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson encodes/decodes severalfold faster than stdlib json, which matters
+# for multi-KB generate responses; fall back to stdlib when not installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One session shared by every helper instance: connections to the Ollama
+# server are pooled and kept alive, so only the first request in the process
+# pays the TCP handshake
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                       max_retries=Retry(total=2, backoff_factor=0.2))
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+_SESSION.headers["Connection"] = "keep-alive"
+
 
 class OllamaHelper:
     def __init__(self, base_url: str = "http://ollama:11434"):
@@ -17,7 +47,7 @@ class OllamaHelper:
             base_url: Ollama server URL
         """
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = _SESSION
 
     def is_available(self) -> bool:
         """Check if Ollama server is available"""
@@ -32,7 +62,8 @@ class OllamaHelper:
         try:
             response = self.session.get(f"{self.base_url}/api/tags")
             if response.status_code == 200:
-                return [model['name'] for model in response.json().get('models', [])]
+                tags = _json_loads(response.content)
+                return [model['name'] for model in tags.get('models', [])]
             return []
         except requests.exceptions.RequestException:
             return []
@@ -42,25 +73,33 @@ class OllamaHelper:
         try:
             response = self.session.post(
                 f"{self.base_url}/api/pull",
-                json={"name": model},
+                data=_json_dumps({"name": model}),
+                headers=_JSON_HEADERS,
                 stream=True
             )
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
 
-    def ask(self, prompt: str, model: str = "llama2", **kwargs) -> Optional[str]:
+    def ask(self, prompt: str, model: str = "llama2", stream: bool = False,
+            **kwargs):
         """
         Ask Ollama a question
 
         Args:
             prompt: The question or prompt
             model: Model to use (default: llama2)
+            stream: If True, return a generator yielding response chunks as
+                they arrive instead of blocking for the full generation
             **kwargs: Additional parameters for the model
 
         Returns:
-            Response text or None if error
+            Response text (or a chunk generator when stream=True),
+            None if error
         """
+        if stream:
+            return self._ask_stream(prompt, model, **kwargs)
+
         try:
             data = {
                 "model": model,
@@ -71,18 +110,99 @@ class OllamaHelper:
 
             response = self.session.post(
                 f"{self.base_url}/api/generate",
-                json=data,
-                timeout=120
+                data=_json_dumps(data),
+                headers=_JSON_HEADERS,
+                timeout=(5, 120)
             )
 
             if response.status_code == 200:
-                return response.json().get('response', '')
+                return _json_loads(response.content).get('response', '')
             return None
 
         except requests.exceptions.RequestException as e:
             print(f"Error asking Ollama: {e}")
             return None
 
+    def _ask_stream(self, prompt: str, model: str, **kwargs):
+        """Yield response chunks from /api/generate as JSON lines arrive
+
+        Latency to first output drops from total generation time to
+        time-to-first-token.
+        """
+        data = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            **kwargs
+        }
+
+        try:
+            with self.session.post(
+                f"{self.base_url}/api/generate",
+                data=_json_dumps(data),
+                headers=_JSON_HEADERS,
+                stream=True,
+                timeout=(5, 120)
+            ) as response:
+                if response.status_code != 200:
+                    return
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    piece = chunk.get('response', '')
+                    if piece:
+                        yield piece
+                    if chunk.get('done'):
+                        break
+        except requests.exceptions.RequestException as e:
+            print(f"Error asking Ollama: {e}")
+
+    def ask_batch(self, prompts: list, model: str = "llama2", **kwargs) -> list:
+        """
+        Ask several independent questions in a single generate call
+
+        Every /api/generate round trip pays connection and model-warmup
+        latency; batching N prompts into one numbered meta-prompt costs one
+        round trip, and the numbered answers are split back out afterwards.
+
+        Args:
+            prompts: List of independent prompts
+            model: Model to use (default: llama2)
+            **kwargs: Additional parameters for the model
+
+        Returns:
+            One response string per prompt (empty where the model skipped
+            a number), or [] if there were no prompts
+        """
+        import re
+
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            response = self.ask(prompts[0], model=model, **kwargs)
+            return [response or ""]
+
+        numbered = "\n\n".join(f"{i}) {p}" for i, p in enumerate(prompts, 1))
+        meta_prompt = (
+            "Answer each numbered question separately. Start each answer "
+            "on a new line with its number followed by a closing "
+            f"parenthesis, like '1)'.\n\n{numbered}"
+        )
+
+        response = self.ask(meta_prompt, model=model, **kwargs)
+        if not response:
+            return ["" for _ in prompts]
+
+        # Split on numbered answer markers at line starts
+        parts = re.split(r"\n\s*(\d+)\)\s*", "\n" + response)
+        answers = ["" for _ in prompts]
+        for idx in range(1, len(parts) - 1, 2):
+            num = int(parts[idx])
+            if 1 <= num <= len(prompts):
+                answers[num - 1] = parts[idx + 1].strip()
+        return answers
+
     def analyze_data(self, data_summary: str, question: str = None) -> str:
         """
         Get AI assistance for data analysis
@@ -165,11 +285,18 @@ def setup_ollama(model: str = "llama2") -> OllamaHelper:
     """Setup Ollama helper and ensure model is available"""
     ollama = OllamaHelper()
 
-    if not ollama.is_available():
+    # One /api/tags round trip answers both "is the server up?" and
+    # "which models does it have?" — no separate availability preflight
+    try:
+        response = ollama.session.get(f"{ollama.base_url}/api/tags", timeout=5)
+    except requests.exceptions.RequestException:
+        response = None
+
+    if response is None or response.status_code != 200:
         print("❌ Ollama server not available. Please start Ollama first.")
         return ollama
 
-    models = ollama.list_models()
+    models = [m['name'] for m in _json_loads(response.content).get('models', [])]
     if model not in models:
         print(f"📥 Pulling {model} model...")
         if ollama.pull_model(model):